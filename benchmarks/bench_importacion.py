@@ -0,0 +1,57 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Raíz del proyecto, para que los módulos se importen igual que desde main.py
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULOS = [
+    'main',
+    'servidor',
+    'services.vehiculo_service',
+    'tools.buscar_placas_por_txt.buscar_placas_por_txt',
+    'tools.extraer_colores.extraer_colores',
+    'tools.extraer_patron_placa_csv.extraer_patron_placa_csv',
+]
+
+# Referencia: lo que costaba arrancar cuando requests y bs4 se importaban siempre
+REFERENCIA = 'requests, bs4'
+
+
+def medir_importacion(modulo, repeticiones=10):
+    """
+    Mide el tiempo de arranque de un intérprete nuevo que importa el módulo
+    Retorna la mediana en milisegundos
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, '-c', f'import {modulo}'],
+                       cwd=PROJECT_ROOT, check=True)
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tiempos)
+
+
+def modulos_pesados_cargados(modulo):
+    """Indica si al importar el módulo se cargan requests o bs4"""
+    codigo = (f'import sys, {modulo}; '
+              'print(",".join(m for m in ("requests", "bs4") if m in sys.modules))')
+    salida = subprocess.run([sys.executable, '-c', codigo], cwd=PROJECT_ROOT,
+                            check=True, capture_output=True, text=True)
+    return salida.stdout.strip() or '-'
+
+
+def main(repeticiones=10):
+    base = medir_importacion('sys', repeticiones)
+    print(f"Intérprete vacío: {base:.1f} ms (mediana de {repeticiones})")
+    print(f"{'Módulo':<60}{'ms':>8}{'+ms':>8}  cargados")
+    for modulo in MODULOS + [REFERENCIA]:
+        tiempo = medir_importacion(modulo, repeticiones)
+        cargados = modulos_pesados_cargados(modulo)
+        print(f"{modulo:<60}{tiempo:>8.1f}{tiempo - base:>8.1f}  {cargados}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,313 @@
+"""
+Micro-benchmarks de las partes de CPU del proyecto (sin red).
+
+Uso, desde la raíz del proyecto:
+    python -m benchmarks.ejecutar                         # dataset de 10k filas
+    python -m benchmarks.ejecutar --tamano 1M -o resultados.json
+    python -m benchmarks.ejecutar --guardar-baseline      # crea benchmarks/baseline.json
+    python -m benchmarks.ejecutar --comparar benchmarks/baseline.json
+
+La baseline depende de la máquina, por eso no se versiona: generarla con
+--guardar-baseline en la misma máquina (y con el mismo --tamano) donde se comparará.
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from benchmarks.generador import TAMANOS, generar_placas, obtener_dataset
+
+DIRECTORIO_BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(DIRECTORIO_BENCHMARKS)
+DIRECTORIO_FIXTURES = os.path.join(DIRECTORIO_BENCHMARKS, 'fixtures')
+ARCHIVO_BASELINE = os.path.join(DIRECTORIO_BENCHMARKS, 'baseline.json')
+
+# nombre -> función que recibe el contexto y retorna (función a medir, operaciones)
+BENCHMARKS = {}
+
+
+def benchmark(nombre):
+    def registrar(preparar):
+        BENCHMARKS[nombre] = preparar
+        return preparar
+    return registrar
+
+
+@benchmark('normalizar_placa')
+def _normalizar_placa(contexto):
+    from services.vehiculo_service import VehiculoService
+    placas = generar_placas(contexto['filas'])
+    normalizar = VehiculoService.normalizar_placa
+
+    def ejecutar():
+        for placa in placas:
+            normalizar(placa)
+    return ejecutar, len(placas)
+
+
+@benchmark('cargar_placas_existentes')
+def _cargar_placas_existentes(contexto):
+    from main import GeneradorConsultorPlacas
+    consultor = GeneradorConsultorPlacas(contexto['dataset'])
+    return consultor._cargar_placas_existentes, contexto['filas']
+
+
+@benchmark('guardar_vehiculo')
+def _guardar_vehiculo(contexto):
+    from main import GeneradorConsultorPlacas
+    from models.vehiculo_model import Vehiculo
+    import csv
+    with open(contexto['dataset'], mode='r', newline='', encoding='utf-8') as file:
+        reader = csv.DictReader(file)
+        vehiculos = [Vehiculo.from_dict(row) for _, row in zip(range(1000), reader)]
+
+    def ejecutar():
+        archivo = os.path.join(contexto['temporal'], 'guardar_vehiculo.csv')
+        if os.path.exists(archivo):
+            os.remove(archivo)
+        consultor = GeneradorConsultorPlacas(archivo)
+        consultor._placas_existentes = set()
+        for vehiculo in vehiculos:
+            consultor.guardar_vehiculo(vehiculo)
+    return ejecutar, len(vehiculos)
+
+
+def _parsear_fixture(nombre_fixture, repeticiones=200):
+    from services.vehiculo_service import VehiculoService
+    with open(os.path.join(DIRECTORIO_FIXTURES, nombre_fixture), 'rb') as file:
+        contenido = file.read()
+    VehiculoService.parsear_html('ABA4135', contenido)  # Carga bs4 fuera de la medición
+
+    def ejecutar():
+        for _ in range(repeticiones):
+            VehiculoService.parsear_html('ABA4135', contenido)
+    return ejecutar, repeticiones
+
+
+@benchmark('parsear_html_encontrado')
+def _parsear_html_encontrado(contexto):
+    return _parsear_fixture('ant_vehiculo_encontrado.html')
+
+
+@benchmark('parsear_html_sin_registro')
+def _parsear_html_sin_registro(contexto):
+    return _parsear_fixture('ant_sin_registro.html')
+
+
+@benchmark('extraer_colores')
+def _extraer_colores(contexto):
+    from tools.extraer_colores.extraer_colores import extraer_y_guardar_colores
+    salida = os.path.join(contexto['temporal'], 'colores.txt')
+    return lambda: extraer_y_guardar_colores(contexto['dataset'], salida), contexto['filas']
+
+
+@benchmark('extraer_patrones')
+def _extraer_patrones(contexto):
+    from tools.extraer_patron_placa_csv.extraer_patron_placa_csv import extraer_patrones
+    salida = os.path.join(contexto['temporal'], 'patrones.txt')
+    return lambda: extraer_patrones(contexto['dataset'], salida), contexto['filas']
+
+
+@benchmark('dataset_tipado')
+def _dataset_tipado(contexto):
+    from models.esquema_vehiculo import DatasetTipado
+    return lambda: DatasetTipado.desde_csv(contexto['dataset']), contexto['filas']
+
+
+# Duración mínima de cada repetición: las operaciones cortas se repiten dentro
+# de una misma medición para que el ruido del sistema pese menos
+DURACION_MINIMA_S = 0.1
+
+
+def medir(funcion, repeticiones, calentamiento):
+    """
+    Ejecuta la función varias veces con el recolector de basura desactivado
+    y sin salida por consola. Retorna el tiempo por llamada de cada repetición,
+    en segundos
+    """
+    def cronometrar(llamadas):
+        gc.collect()
+        gc.disable()
+        try:
+            inicio = time.perf_counter()
+            for _ in range(llamadas):
+                funcion()
+            return time.perf_counter() - inicio
+        finally:
+            gc.enable()
+
+    tiempos = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(calentamiento):
+            funcion()
+
+        # Calibrar cuántas llamadas forman una repetición, como timeit.autorange
+        llamadas = 1
+        while cronometrar(llamadas) < DURACION_MINIMA_S:
+            llamadas *= 2
+
+        for _ in range(repeticiones):
+            tiempos.append(cronometrar(llamadas) / llamadas)
+    return tiempos
+
+
+def _contexto(tamano, temporal):
+    return {
+        'dataset': obtener_dataset(tamano),
+        'filas': TAMANOS[tamano],
+        'temporal': temporal,
+    }
+
+
+def _trabajador(nombre, tamano, repeticiones, calentamiento):
+    """Mide un benchmark en este proceso e imprime los tiempos en JSON"""
+    with tempfile.TemporaryDirectory() as temporal:
+        funcion, operaciones = BENCHMARKS[nombre](_contexto(tamano, temporal))
+        tiempos = medir(funcion, repeticiones, calentamiento)
+    print(json.dumps({'tiempos': tiempos, 'operaciones': operaciones}))
+
+
+def _medir_en_proceso(nombre, tamano, repeticiones, calentamiento):
+    """Ejecuta un benchmark en un intérprete nuevo y retorna sus tiempos"""
+    salida = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.ejecutar', '--trabajador', nombre, '--tamano', tamano,
+         '--repeticiones', str(repeticiones), '--calentamiento', str(calentamiento)],
+        cwd=PROJECT_ROOT, check=True, capture_output=True, text=True)
+    return json.loads(salida.stdout.splitlines()[-1])
+
+
+def ejecutar_benchmarks(tamano='10k', repeticiones=10, calentamiento=1, filtro=None, procesos=5):
+    """
+    Ejecuta los benchmarks seleccionados y retorna el resultado en formato JSON.
+    Cada benchmark se mide en varios procesos nuevos, porque la velocidad cambia
+    de un proceso a otro (ubicación en la CPU, memoria) y no solo entre repeticiones
+    """
+    obtener_dataset(tamano)  # Generarlo una sola vez antes de lanzar los procesos
+    resultados = {}
+
+    for nombre in BENCHMARKS:
+        if filtro and filtro not in nombre:
+            continue
+
+        tiempos = []
+        for _ in range(procesos):
+            medicion = _medir_en_proceso(nombre, tamano, repeticiones, calentamiento)
+            tiempos.extend(medicion['tiempos'])
+        operaciones = medicion['operaciones']
+
+        mediana = statistics.median(tiempos)
+        resultados[nombre] = {
+            'mediana_s': mediana,
+            'minimo_s': min(tiempos),
+            'desviacion_s': statistics.stdev(tiempos) if len(tiempos) > 1 else 0.0,
+            'operaciones': operaciones,
+            'ns_por_operacion': mediana / operaciones * 1e9,
+        }
+        print(f"{nombre:<30}{mediana * 1000:>12.2f} ms"
+              f"{resultados[nombre]['ns_por_operacion']:>14.0f} ns/op")
+
+    return {
+        'meta': {
+            'fecha': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'tamano': tamano,
+            'repeticiones': repeticiones,
+            'procesos': procesos,
+        },
+        'resultados': resultados,
+    }
+
+
+# Desviaciones estándar que se consideran ruido al comparar con la baseline
+SIGMAS_RUIDO = 3
+
+
+def comparar(actual, baseline, tolerancia):
+    """
+    Compara el tiempo mínimo de cada benchmark con el de la baseline.
+    Solo es regresión si el aumento supera la tolerancia relativa y también
+    la banda de ruido (SIGMAS_RUIDO desviaciones de la ejecución más ruidosa)
+    Retorna la lista de benchmarks que empeoraron
+    """
+    if actual['meta']['tamano'] != baseline['meta']['tamano']:
+        print(f"Aviso: la baseline usa el tamaño {baseline['meta']['tamano']}, "
+              f"esta ejecución {actual['meta']['tamano']}")
+
+    regresiones = []
+    print(f"\n{'Benchmark':<30}{'baseline ms':>14}{'actual ms':>14}{'cambio':>10}{'umbral':>10}")
+    for nombre, resultado in actual['resultados'].items():
+        anterior = baseline['resultados'].get(nombre)
+        if anterior is None:
+            print(f"{nombre:<30}{'-':>14}{resultado['minimo_s'] * 1000:>14.2f}{'nuevo':>10}")
+            continue
+
+        ruido = SIGMAS_RUIDO * max(anterior['desviacion_s'], resultado['desviacion_s'])
+        umbral = max(anterior['minimo_s'] * tolerancia, ruido)
+        diferencia = resultado['minimo_s'] - anterior['minimo_s']
+        es_regresion = diferencia > umbral
+
+        marca = '  REGRESIÓN' if es_regresion else ''
+        print(f"{nombre:<30}{anterior['minimo_s'] * 1000:>14.2f}{resultado['minimo_s'] * 1000:>14.2f}"
+              f"{diferencia / anterior['minimo_s']:>+10.1%}{umbral / anterior['minimo_s']:>+10.1%}{marca}")
+        if es_regresion:
+            regresiones.append(nombre)
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks offline del proyecto")
+    parser.add_argument('--tamano', default='10k', choices=list(TAMANOS),
+                        help="Tamaño del dataset sintético")
+    parser.add_argument('--repeticiones', type=int, default=10,
+                        help="Repeticiones por proceso")
+    parser.add_argument('--procesos', type=int, default=5,
+                        help="Procesos nuevos en los que se mide cada benchmark")
+    parser.add_argument('--calentamiento', type=int, default=1)
+    parser.add_argument('--filtro', help="Ejecutar solo los benchmarks que contengan este texto")
+    parser.add_argument('-o', '--salida', help="Archivo JSON donde guardar los resultados")
+    parser.add_argument('--comparar', metavar='BASELINE', help="JSON de baseline a comparar")
+    parser.add_argument('--tolerancia', type=float, default=0.2,
+                        help="Empeoramiento mínimo del tiempo mínimo para marcar regresión "
+                             "(0.2 = 20%%); nunca menor que la banda de ruido")
+    parser.add_argument('--guardar-baseline', action='store_true',
+                        help=f"Guardar los resultados como baseline en {ARCHIVO_BASELINE}")
+    parser.add_argument('--trabajador', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.trabajador:
+        _trabajador(args.trabajador, args.tamano, args.repeticiones, args.calentamiento)
+        return
+
+    resultado = ejecutar_benchmarks(args.tamano, args.repeticiones, args.calentamiento, args.filtro,
+                                    args.procesos)
+
+    salidas = [args.salida] if args.salida else []
+    if args.guardar_baseline:
+        salidas.append(ARCHIVO_BASELINE)
+    for salida in salidas:
+        with open(salida, 'w', encoding='utf-8') as file:
+            json.dump(resultado, file, indent=2)
+            file.write('\n')
+        print(f"Resultados guardados en: {os.path.abspath(salida)}")
+
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as file:
+            baseline = json.load(file)
+        regresiones = comparar(resultado, baseline, args.tolerancia)
+        if regresiones:
+            print(f"\nRegresiones detectadas: {', '.join(regresiones)}")
+            sys.exit(1)
+        print("\nSin regresiones")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import csv
+import os
+import random
+import string
+from models.vehiculo_model import PROVINCIAS, Vehiculo
+
+DIRECTORIO_DATOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'datos')
+
+# Tamaños predefinidos de dataset sintético
+TAMANOS = {
+    '10k': 10_000,
+    '1M': 1_000_000,
+    '10M': 10_000_000,
+}
+
+MARCAS = {
+    'CHEVROLET': ['AVEO', 'SPARK', 'SAIL', 'D-MAX', 'CAPRICE'],
+    'HYUNDAI': ['TUCSON', 'ACCENT', 'I10', 'SANTA FE'],
+    'KIA': ['RIO', 'SPORTAGE', 'PICANTO', 'SORENTO'],
+    'TOYOTA': ['HILUX', 'YARIS', 'COROLLA', 'FORTUNER'],
+    'NISSAN': ['SENTRA', 'FRONTIER', 'KICKS'],
+}
+COLORES = ['BLANCO', 'NEGRO', 'PLOMO', 'ROJO', 'AZUL', 'GRIS', 'PLATEADO', 'VERDE']
+CLASES = ['AUTOMOVIL', 'VEHICULO UTILITARIO', 'CAMIONETA', 'JEEP']
+SERVICIOS = ['USO PARTICULAR', 'ALQUILER', 'ESTADO']
+
+
+def generar_fila(rng, letras_provincia):
+    """Genera una fila con la forma de las del dataset real"""
+    marca = rng.choice(list(MARCAS))
+    anio = rng.randint(1975, 2024)
+    anio_matricula = rng.randint(anio, 2024)
+    dia, mes = rng.randint(1, 28), rng.randint(1, 12)
+    return {
+        'placa': (rng.choice(letras_provincia)
+                  + ''.join(rng.choices(string.ascii_uppercase, k=2))
+                  + f"{rng.randint(0, 9999):04d}"),
+        'marca': marca,
+        'modelo': rng.choice(MARCAS[marca]),
+        'anio': anio,
+        'color': rng.choice(COLORES),
+        'clase': rng.choice(CLASES),
+        'fecha_matricula': f"{dia:02d}-{mes:02d}-{anio_matricula}",
+        'anio_matricula': anio_matricula,
+        'servicio': rng.choice(SERVICIOS),
+        'fecha_caducidad': f"{dia:02d}-{mes:02d}-{anio_matricula + 5}",
+        'polarizado': 'No existe registro de polarizado',
+    }
+
+
+def generar_dataset(filas, archivo, semilla=0):
+    """Escribe un dataset sintético de la cantidad de filas indicada"""
+    rng = random.Random(semilla)
+    letras_provincia = list(PROVINCIAS.values())
+    with open(archivo, mode='w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=Vehiculo.CAMPOS_CSV)
+        writer.writeheader()
+        for _ in range(filas):
+            writer.writerow(generar_fila(rng, letras_provincia))
+
+
+def obtener_dataset(tamano, semilla=0):
+    """
+    Retorna la ruta de un dataset sintético del tamaño indicado ('10k', '1M', '10M').
+    Se genera una sola vez y se reutiliza en las siguientes ejecuciones
+    """
+    os.makedirs(DIRECTORIO_DATOS, exist_ok=True)
+    archivo = os.path.join(DIRECTORIO_DATOS, f"dataset_{tamano}_{semilla}.csv")
+    if not os.path.exists(archivo):
+        print(f"Generando dataset sintético de {TAMANOS[tamano]} filas en {archivo}...")
+        temporal = archivo + '.tmp'
+        generar_dataset(TAMANOS[tamano], temporal, semilla)
+        os.replace(temporal, archivo)
+    return archivo
+
+
+def generar_placas(cantidad, semilla=0):
+    """Placas en los distintos formatos que recibe normalizar_placa, incluidas inválidas"""
+    rng = random.Random(semilla)
+    formatos = [
+        lambda: ''.join(rng.choices(string.ascii_uppercase, k=3)) + f"{rng.randint(0, 9999):04d}",
+        lambda: ''.join(rng.choices(string.ascii_lowercase, k=3)) + f"{rng.randint(0, 999):03d}",
+        lambda: ''.join(rng.choices(string.ascii_uppercase, k=3)) + f"-{rng.randint(0, 9999):04d}",
+        lambda: ''.join(rng.choices(string.ascii_uppercase, k=2)) + f"{rng.randint(0, 999):03d}"
+        + rng.choice(string.ascii_uppercase),
+        lambda: ''.join(rng.choices(string.ascii_uppercase + string.digits, k=rng.randint(4, 9))),
+    ]
+    return [rng.choice(formatos)() for _ in range(cantidad)]
@@ -2,44 +2,31 @@ import csv
 import random
 import string
 import time
-import requests
+from models.vehiculo_model import PROVINCIAS
 from services.vehiculo_service import VehiculoService
 
-PROVINCIAS = {
-    'Azuay': 'A',
-    'Bolívar': 'B',
-    'Cañar': 'U',
-    'Carchi': 'C',
-    'Cotopaxi': 'X',
-    'Chimborazo': 'H',
-    'El Oro': 'O',
-    'Esmeraldas': 'E',
-    'Galápagos': 'W',
-    'Guayas': 'G',
-    'Imbabura': 'I',
-    'Loja': 'L',
-    'Los Ríos': 'R',
-    'Manabí': 'M',
-    'Morona': 'V',
-    'Napo': 'N',
-    'Pastaza': 'S',
-    'Pichincha': 'P',
-    'Santa Elena': 'Y',
-    'Santo Domingo': 'J',
-    'Sucumbíos': 'K',
-    'Tungurahua': 'T',
-    'Zamora': 'Z'
-}
-
 
 class GeneradorConsultorPlacas:
-    def __init__(self, archivo_dataset='dataset.csv'):
+    def __init__(self, archivo_dataset='dataset.csv', dataset_tipado=None):
+        """
+        :param archivo_dataset: CSV donde se guardan los vehículos
+        :param dataset_tipado: DatasetTipado opcional que recibe cada vehículo guardado,
+            ya convertido, para poder filtrarlo sin volver a leer el CSV
+        """
         self.archivo_dataset = archivo_dataset
-        self.placas_existentes = self._cargar_placas_existentes()
+        self.dataset_tipado = dataset_tipado
+        self._placas_existentes = None
         self.patron_valido_actual = None
         self.ultimo_numero = 0
         self.max_variaciones = 10  # Máximo de variaciones numéricas por patrón válido
 
+    @property
+    def placas_existentes(self):
+        """Conjunto de placas del dataset, cargado la primera vez que se usa"""
+        if self._placas_existentes is None:
+            self._placas_existentes = self._cargar_placas_existentes()
+        return self._placas_existentes
+
     def _cargar_placas_existentes(self):
         """Carga las placas existentes del dataset para evitar duplicados"""
         try:
@@ -95,7 +82,12 @@ class GeneradorConsultorPlacas:
                 writer.writeheader()
             writer.writerow(vehiculo.to_dict())
 
-        self.placas_existentes.add(vehiculo.placa)
+        # Si aún no se cargaron, la placa se leerá del archivo al cargarlas
+        if self._placas_existentes is not None:
+            self._placas_existentes.add(vehiculo.placa)
+
+        if self.dataset_tipado is not None:
+            self.dataset_tipado.agregar(vehiculo)
 
     def procesar_placas(self, cantidad, provincia=None, delay=2):
         placas_procesadas = 0
@@ -204,6 +196,48 @@ class GeneradorConsultorPlacas:
         print(
             f"\nProceso completado. Placas encontradas: {placas_encontradas}/{len(placas_a_buscar)}")
 
+    def procesar_placas_desde_archivo_en_paralelo(self, archivo_placas, hilos=4, delay=2):
+        """
+        Igual que procesar_placas_desde_archivo, pero descarga varias placas a la vez
+        y parsea las respuestas en un pool de procesos
+        :param archivo_placas: Ruta del archivo con las placas (una por línea)
+        :param hilos: Cantidad de consultas simultáneas al portal
+        :param delay: Tiempo de espera de cada hilo entre consultas (en segundos)
+        """
+        from services.pipeline_service import PipelineConsultas
+
+        try:
+            with open(archivo_placas, mode='r', encoding='utf-8') as file:
+                placas_a_buscar = [line.strip().upper()
+                                   for line in file if line.strip()]
+        except FileNotFoundError:
+            print(f"Error: Archivo {archivo_placas} no encontrado")
+            return
+
+        # Normalizar antes de deduplicar, para que ABC123 y ABC0123 cuenten como una sola
+        placas_normalizadas = {}
+        for placa in placas_a_buscar:
+            placa_normalizada = VehiculoService.normalizar_placa(placa)
+            if not placa_normalizada:
+                print(f"Placa {placa} no tiene formato válido, saltando...")
+                continue
+            placas_normalizadas[placa_normalizada] = None
+
+        placas_a_buscar = [
+            placa for placa in placas_normalizadas if placa not in self.placas_existentes]
+
+        if not placas_a_buscar:
+            print("El archivo no contiene placas nuevas")
+            return
+
+        print(f"\nIniciando búsqueda de {len(placas_a_buscar)} placas con {hilos} hilos...")
+        pipeline = PipelineConsultas(
+            self.guardar_vehiculo, hilos_descarga=hilos, delay=delay)
+        placas_encontradas = pipeline.procesar(placas_a_buscar)
+
+        print(
+            f"\nProceso completado. Placas encontradas: {placas_encontradas}/{len(placas_a_buscar)}")
+
     def procesar_placas_desde_patron(self, patron, cantidad, delay=2):
         """
         Genera y consulta placas basadas en un patrón de 3 letras
@@ -320,7 +354,7 @@ class GeneradorConsultorPlacas:
         return placas_encontradas
 
 
-if __name__ == "__main__":
+def main():
     consultor = GeneradorConsultorPlacas()
 
     print("Sistema de Consulta de Placas Vehiculares")
@@ -329,6 +363,7 @@ if __name__ == "__main__":
     print("2. Consultar placas desde archivo")
     print("3. Generar desde patrón de 3 letras")
     print("4. Procesar múltiples patrones desde archivo")
+    print("5. Consultar placas desde archivo (en paralelo)")
 
     try:
         opcion = int(input("\nSeleccione una opción: "))
@@ -371,7 +406,7 @@ if __name__ == "__main__":
             archivo = input(
                 "Ingrese la ruta del archivo con los patrones (o Enter para 'patrones.txt'): ").strip()
             if not archivo:
-                archivo = 'tools\extraer_patron_placa_csv\patrones.txt'
+                archivo = 'patrones.txt'
 
             cantidad = int(
                 input("Ingrese la cantidad de placas a generar por patrón: "))
@@ -379,8 +414,19 @@ if __name__ == "__main__":
                 consultor.procesar_patrones_desde_archivo(archivo, cantidad)
             else:
                 print("La cantidad debe ser mayor a 0")
+        elif opcion == 5:
+            archivo = input("Ingrese la ruta del archivo con las placas: ")
+            hilos = int(input("Ingrese la cantidad de consultas simultáneas: "))
+            if hilos > 0:
+                consultor.procesar_placas_desde_archivo_en_paralelo(archivo, hilos)
+            else:
+                print("La cantidad debe ser mayor a 0")
         else:
             print("Opción no válida")
 
     except ValueError:
         print("Por favor ingrese un número válido")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+import csv
+import unicodedata
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from models.vehiculo_model import PROVINCIAS, Vehiculo
+
+SIN_POLARIZADO = 'No existe registro de polarizado'
+
+
+def parsear_entero(valor):
+    """Convierte '2011' en 2011; retorna None si está vacío o no es numérico"""
+    try:
+        return int(valor)
+    except (TypeError, ValueError):
+        return None
+
+
+def parsear_fecha(valor):
+    """Convierte una fecha dd-mm-yyyy del portal ANT en date; None si no es válida"""
+    try:
+        dia, mes, anio = valor.split('-')
+        return date(int(anio), int(mes), int(dia))
+    except (AttributeError, ValueError):
+        return None
+
+
+def parsear_polarizado(valor):
+    """True si hay registro de polarizado, False si no, None si no hay dato"""
+    if not valor:
+        return None
+    return valor != SIN_POLARIZADO
+
+
+# Conversión de cada campo de Vehiculo a su tipo; los que no aparecen quedan como texto
+ESQUEMA = {
+    'anio': parsear_entero,
+    'anio_matricula': parsear_entero,
+    'fecha_matricula': parsear_fecha,
+    'fecha_caducidad': parsear_fecha,
+    'polarizado': parsear_polarizado,
+}
+
+
+def convertir_vehiculo(vehiculo):
+    """Retorna el diccionario del vehículo con los campos ya tipados"""
+    datos = vehiculo.to_dict()
+    for campo, conversor in ESQUEMA.items():
+        datos[campo] = conversor(datos[campo])
+    return datos
+
+
+def _sin_acentos(texto):
+    """'Los Ríos' -> 'los rios', para comparar nombres sin importar tildes ni mayúsculas"""
+    descompuesto = unicodedata.normalize('NFKD', texto)
+    return ''.join(c for c in descompuesto if not unicodedata.combining(c)).casefold()
+
+
+def _letra_provincia(provincia):
+    """
+    Acepta el nombre de la provincia sin importar mayúsculas ni tildes ('los rios')
+    o su letra ('R'). Lanza ValueError si no es ninguno de los dos
+    """
+    nombre = _sin_acentos(provincia.strip())
+    for nombre_provincia, letra in PROVINCIAS.items():
+        if _sin_acentos(nombre_provincia) == nombre:
+            return letra
+
+    if len(nombre) == 1 and nombre.isalpha():
+        return nombre.upper()
+
+    raise ValueError(
+        f"Provincia desconocida: {provincia}. Use el nombre de la provincia o la letra de la placa")
+
+
+class DatasetTipado:
+    """
+    Dataset en formato columnar con los valores ya convertidos.
+    Años y fechas se guardan en arreglos de enteros (las fechas como ordinal,
+    0 cuando falta el dato) para que los filtros comparen números y no texto.
+    Las columnas filtrables por rango tienen un índice ordenado que se construye
+    en el primer filtro y se mantiene al agregar vehículos.
+    """
+
+    # Columnas con índice ordenado para filtros por rango
+    COLUMNAS_INDEXADAS = ('anio', 'fecha_caducidad')
+
+    # Columnas numéricas: campo -> código de tipo de array
+    COLUMNAS_NUMERICAS = {
+        'anio': 'i',
+        'anio_matricula': 'i',
+        'fecha_matricula': 'i',
+        'fecha_caducidad': 'i',
+    }
+
+    def __init__(self):
+        self.columnas = {campo: (array(self.COLUMNAS_NUMERICAS[campo])
+                                 if campo in self.COLUMNAS_NUMERICAS else [])
+                         for campo in Vehiculo.CAMPOS_CSV}
+        self.columnas['polarizado'] = bytearray()
+        # campo -> (valores ordenados, posición de cada valor en la columna)
+        self._indices = {}
+        # letra inicial de la placa -> posiciones, en orden
+        self._por_letra = None
+
+    def __len__(self):
+        return len(self.columnas['placa'])
+
+    @staticmethod
+    def _a_columna(campo, valor):
+        """Valor tipado -> valor almacenado en la columna"""
+        if campo in ('fecha_matricula', 'fecha_caducidad'):
+            return valor.toordinal() if valor else 0
+        if campo == 'polarizado':
+            return {None: 2, False: 0, True: 1}[valor]
+        if campo in DatasetTipado.COLUMNAS_NUMERICAS:
+            return valor or 0
+        return valor
+
+    def agregar(self, vehiculo):
+        """Convierte y agrega un vehículo recién consultado, actualizando los índices"""
+        posicion = len(self)
+        for campo, valor in convertir_vehiculo(vehiculo).items():
+            self.columnas[campo].append(self._a_columna(campo, valor))
+
+        for campo, (valores, posiciones) in self._indices.items():
+            valor = self.columnas[campo][posicion]
+            i = bisect_right(valores, valor)
+            valores.insert(i, valor)
+            posiciones.insert(i, posicion)
+
+        if self._por_letra is not None:
+            letra = (self.columnas['placa'][posicion] or '')[:1].upper()
+            self._por_letra.setdefault(letra, []).append(posicion)
+
+    def _indice(self, campo):
+        """Retorna (valores ordenados, posiciones) de la columna; se construye al primer uso"""
+        if campo not in self._indices:
+            columna = self.columnas[campo]
+            posiciones = sorted(range(len(columna)), key=columna.__getitem__)
+            valores = array(self.COLUMNAS_NUMERICAS[campo], (columna[i] for i in posiciones))
+            self._indices[campo] = (valores, posiciones)
+        return self._indices[campo]
+
+    def _rango(self, campo, minimo, maximo):
+        """Posiciones cuyo valor está entre minimo y maximo (inclusive), por búsqueda binaria"""
+        valores, posiciones = self._indice(campo)
+        return posiciones[bisect_left(valores, minimo):bisect_right(valores, maximo)]
+
+    def _posiciones_provincia(self, letra):
+        if self._por_letra is None:
+            self._por_letra = {}
+            for posicion, placa in enumerate(self.columnas['placa']):
+                self._por_letra.setdefault((placa or '')[:1].upper(), []).append(posicion)
+        return self._por_letra.get(letra, [])
+
+    @classmethod
+    def desde_csv(cls, archivo_dataset='dataset.csv'):
+        """
+        Convierte el CSV completo leyéndolo fila por fila directo a las columnas.
+        Cada valor distinto de una columna tipada se parsea una sola vez, ya que
+        años y fechas se repiten mucho entre filas
+        """
+        dataset = cls()
+        try:
+            with open(archivo_dataset, mode='r', newline='', encoding='utf-8') as file:
+                reader = csv.reader(file)
+                encabezado = next(reader, None)
+                if encabezado is None:
+                    return dataset
+
+                posiciones = {campo: i for i, campo in enumerate(encabezado)}
+                # (posición en el CSV, columna destino, memo de valores ya convertidos, campo)
+                destinos = [(posiciones.get(campo), dataset.columnas[campo],
+                             {} if campo in ESQUEMA else None, campo)
+                            for campo in Vehiculo.CAMPOS_CSV]
+
+                for fila in reader:
+                    if not fila:
+                        continue
+                    for posicion, columna, memo, campo in destinos:
+                        texto = fila[posicion] if posicion is not None and posicion < len(fila) else None
+                        if memo is None:
+                            columna.append(texto)
+                            continue
+
+                        valor = memo.get(texto)
+                        if valor is None:
+                            valor = memo[texto] = cls._a_columna(campo, ESQUEMA[campo](texto))
+                        columna.append(valor)
+        except FileNotFoundError:
+            pass
+
+        return dataset
+
+    def filtrar(self, anio_desde=None, anio_hasta=None, caduca_desde=None, caduca_hasta=None,
+                provincia=None):
+        """
+        Retorna los índices de las filas que cumplen todos los filtros indicados
+        :param anio_desde: Año mínimo del vehículo (inclusive)
+        :param anio_hasta: Año máximo del vehículo (inclusive)
+        :param caduca_desde: date mínima de fecha_caducidad (inclusive)
+        :param caduca_hasta: date máxima de fecha_caducidad (inclusive)
+        :param provincia: Nombre de la provincia o letra inicial de la placa
+        """
+        candidatos = []
+
+        if anio_desde is not None or anio_hasta is not None:
+            minimo = anio_desde if anio_desde is not None else 1
+            maximo = anio_hasta if anio_hasta is not None else 9999
+            candidatos.append(self._rango('anio', max(minimo, 1), maximo))
+
+        if caduca_desde is not None or caduca_hasta is not None:
+            minimo = caduca_desde.toordinal() if caduca_desde else 1
+            maximo = caduca_hasta.toordinal() if caduca_hasta else date.max.toordinal()
+            candidatos.append(self._rango('fecha_caducidad', minimo, maximo))
+
+        if provincia is not None:
+            candidatos.append(self._posiciones_provincia(_letra_provincia(provincia)))
+
+        if not candidatos:
+            return list(range(len(self)))
+
+        # Intersectar empezando por el filtro más selectivo
+        candidatos.sort(key=len)
+        resultado = set(candidatos[0])
+        for posiciones in candidatos[1:]:
+            resultado.intersection_update(posiciones)
+        return sorted(resultado)
+
+    def fila(self, indice):
+        """Retorna la fila como diccionario con valores tipados"""
+        datos = {}
+        for campo, columna in self.columnas.items():
+            valor = columna[indice]
+            if campo in ('fecha_matricula', 'fecha_caducidad'):
+                valor = date.fromordinal(valor) if valor else None
+            elif campo == 'polarizado':
+                valor = (False, True, None)[valor]
+            elif campo in self.COLUMNAS_NUMERICAS:
+                valor = valor or None
+            datos[campo] = valor
+        return datos
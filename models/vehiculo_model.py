@@ -1,4 +1,39 @@
+# Provincias de Ecuador y la letra con la que inician sus placas
+PROVINCIAS = {
+    'Azuay': 'A',
+    'Bolívar': 'B',
+    'Cañar': 'U',
+    'Carchi': 'C',
+    'Cotopaxi': 'X',
+    'Chimborazo': 'H',
+    'El Oro': 'O',
+    'Esmeraldas': 'E',
+    'Galápagos': 'W',
+    'Guayas': 'G',
+    'Imbabura': 'I',
+    'Loja': 'L',
+    'Los Ríos': 'R',
+    'Manabí': 'M',
+    'Morona': 'V',
+    'Napo': 'N',
+    'Pastaza': 'S',
+    'Pichincha': 'P',
+    'Santa Elena': 'Y',
+    'Santo Domingo': 'J',
+    'Sucumbíos': 'K',
+    'Tungurahua': 'T',
+    'Zamora': 'Z'
+}
+
+
 class Vehiculo:
+    # Orden de las columnas en dataset.csv
+    CAMPOS_CSV = [
+        'placa', 'marca', 'modelo', 'anio', 'color',
+        'clase', 'fecha_matricula', 'anio_matricula', 'servicio',
+        'fecha_caducidad', 'polarizado'
+    ]
+
     def __init__(self, placa, marca, color, anio_matricula, modelo, clase, fecha_matricula, anio, servicio, fecha_caducidad, polarizado):
         self.placa = placa
         self.marca = marca
@@ -39,3 +74,8 @@ class Vehiculo:
             "fecha_caducidad": self.fecha_caducidad,
             "polarizado": self.polarizado
         }
+
+    @classmethod
+    def from_dict(cls, datos):
+        """Construye un Vehiculo a partir de una fila del dataset"""
+        return cls(**{campo: datos.get(campo) for campo in cls.CAMPOS_CSV})
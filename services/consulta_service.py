@@ -0,0 +1,203 @@
+import csv
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from models.vehiculo_model import Vehiculo
+from services.vehiculo_service import VehiculoService
+
+
+class LimiteExcedidoError(RuntimeError):
+    """Se lanza cuando un cliente supera su cuota de consultas al portal ANT"""
+
+
+class CacheLRU:
+    """
+    Cache acotada con política LRU y expiración por tiempo (TTL)
+    Es segura para usarse desde varios hilos
+    """
+
+    def __init__(self, capacidad=1024, ttl=3600):
+        self.capacidad = capacidad
+        self.ttl = ttl
+        self._datos = OrderedDict()
+        self._lock = threading.Lock()
+
+    def obtener(self, clave):
+        """
+        Retorna (encontrado, valor). Las entradas vencidas se descartan
+        """
+        with self._lock:
+            entrada = self._datos.get(clave)
+            if entrada is None:
+                return False, None
+
+            expira, valor = entrada
+            if expira < time.monotonic():
+                del self._datos[clave]
+                return False, None
+
+            self._datos.move_to_end(clave)
+            return True, valor
+
+    def guardar(self, clave, valor):
+        with self._lock:
+            self._datos[clave] = (time.monotonic() + self.ttl, valor)
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.capacidad:
+                self._datos.popitem(last=False)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._datos)
+
+
+class LimitadorTasa:
+    """
+    Limitador por cliente basado en token bucket
+    :param tasa: Consultas permitidas por segundo
+    :param rafaga: Máximo de consultas acumulables
+    """
+
+    def __init__(self, tasa=0.5, rafaga=5):
+        self.tasa = tasa
+        self.rafaga = rafaga
+        self._clientes = {}
+        self._lock = threading.Lock()
+        self._ultima_limpieza = time.monotonic()
+
+    def _limpiar(self, ahora):
+        """
+        Descarta los clientes cuyo bucket ya se llenó de nuevo: volverían a
+        empezar con la ráfaga completa, así que no hace falta recordarlos
+        """
+        self._clientes = {cliente: (tokens, ultimo)
+                          for cliente, (tokens, ultimo) in self._clientes.items()
+                          if tokens + (ahora - ultimo) * self.tasa < self.rafaga}
+        self._ultima_limpieza = ahora
+
+    def permitir(self, cliente):
+        ahora = time.monotonic()
+        with self._lock:
+            # Como mucho una limpieza por cada tiempo de llenado del bucket
+            if ahora - self._ultima_limpieza >= self.rafaga / self.tasa:
+                self._limpiar(ahora)
+
+            tokens, ultimo = self._clientes.get(cliente, (self.rafaga, ahora))
+            tokens = min(self.rafaga, tokens + (ahora - ultimo) * self.tasa)
+            if tokens < 1:
+                self._clientes[cliente] = (tokens, ahora)
+                return False
+            self._clientes[cliente] = (tokens - 1, ahora)
+            return True
+
+
+class ConsultaService:
+    """
+    Búsqueda de vehículos por placa sobre un índice en memoria del dataset.
+    Las placas que no están en el índice se consultan al portal ANT a través
+    de una cache LRU con TTL; las encontradas se guardan en el dataset.
+    """
+
+    def __init__(self, archivo_dataset='dataset.csv', capacidad_cache=1024, ttl_cache=3600,
+                 limitador=None, consultar=None):
+        self.archivo_dataset = archivo_dataset
+        self.cache = CacheLRU(capacidad_cache, ttl_cache)
+        self.limitador = limitador or LimitadorTasa()
+        self._consultar = consultar or VehiculoService.obtener_informacion_vehiculo
+        self._en_curso = {}
+        self._lock = threading.Lock()
+        self._lock_escritura = threading.Lock()
+        self.indice = self._cargar_indice()
+
+    def _cargar_indice(self):
+        """Carga el dataset completo en un diccionario placa -> Vehiculo"""
+        try:
+            with open(self.archivo_dataset, mode='r', newline='', encoding='utf-8') as file:
+                reader = csv.DictReader(file)
+                return {row['placa']: Vehiculo.from_dict(row) for row in reader}
+        except FileNotFoundError:
+            return {}
+
+    def _guardar_vehiculo(self, vehiculo):
+        with self._lock_escritura:
+            file_exists = os.path.isfile(self.archivo_dataset)
+            with open(self.archivo_dataset, mode='a', newline='', encoding='utf-8') as file:
+                writer = csv.DictWriter(file, fieldnames=Vehiculo.CAMPOS_CSV)
+                if not file_exists:
+                    writer.writeheader()
+                writer.writerow(vehiculo.to_dict())
+
+    def buscar(self, placa, cliente=None):
+        """
+        Retorna el Vehiculo de la placa o None si el portal no tiene registro
+        :param placa: Placa en cualquier formato aceptado por normalizar_placa
+        :param cliente: Identificador usado para limitar las consultas al portal
+        """
+        placa_normalizada = VehiculoService.normalizar_placa(placa)
+        if not placa_normalizada:
+            raise ValueError(
+                f"Formato de placa inválido: {placa}. Formatos aceptados: ABC123, ABC0123 o JK563Y")
+
+        vehiculo = self.indice.get(placa_normalizada)
+        if vehiculo is not None:
+            return vehiculo
+
+        encontrado, vehiculo = self.cache.obtener(placa_normalizada)
+        if encontrado:
+            return vehiculo
+
+        # Si otra petición ya está consultando la misma placa, esperamos su resultado
+        with self._lock:
+            # Se vuelve a revisar: otra petición pudo terminar la consulta entre tanto
+            vehiculo = self.indice.get(placa_normalizada)
+            if vehiculo is not None:
+                return vehiculo
+            encontrado, vehiculo = self.cache.obtener(placa_normalizada)
+            if encontrado:
+                return vehiculo
+
+            futuro = self._en_curso.get(placa_normalizada)
+            propietario = futuro is None
+            if propietario:
+                if not self.limitador.permitir(cliente):
+                    raise LimiteExcedidoError(
+                        f"Límite de consultas excedido para el cliente {cliente}")
+                futuro = Future()
+                self._en_curso[placa_normalizada] = futuro
+
+        if not propietario:
+            return futuro.result()
+
+        try:
+            vehiculo = self._consultar(placa_normalizada)
+            if vehiculo:
+                self._guardar_vehiculo(vehiculo)
+                self.indice[placa_normalizada] = vehiculo
+            self.cache.guardar(placa_normalizada, vehiculo)
+            futuro.set_result(vehiculo)
+            return vehiculo
+        except Exception as e:
+            futuro.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._en_curso[placa_normalizada]
+
+    def buscar_lote(self, placas, cliente=None):
+        """
+        Busca varias placas y retorna un diccionario placa -> dict o None.
+        Las placas inválidas o con error se reportan con la clave 'error'
+        """
+        resultados = {}
+        for placa in placas:
+            try:
+                vehiculo = self.buscar(placa, cliente)
+                resultados[placa] = vehiculo.to_dict() if vehiculo else None
+            except (ValueError, RuntimeError) as e:
+                resultados[placa] = {'error': str(e)}
+            except Exception as e:
+                # Un fallo inesperado (p. ej. al parsear la respuesta) no debe perder el lote
+                resultados[placa] = {'error': f"Error inesperado: {str(e)}"}
+        return resultados
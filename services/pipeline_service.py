@@ -0,0 +1,185 @@
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from services.vehiculo_service import VehiculoService
+
+# Marca de fin de datos entre etapas
+_FIN = object()
+
+# Cada cuánto revisan las etapas si se pidió detener el pipeline (en segundos)
+_ESPERA = 0.1
+
+
+class PipelineConsultas:
+    """
+    Consulta placas en tres etapas conectadas por colas acotadas:
+    1. Descarga: varios hilos obtienen el HTML del portal ANT
+    2. Parseo: un pool de procesos convierte el HTML en Vehiculo
+    3. Escritura: el hilo que llama a procesar guarda los resultados
+
+    Si el parseo o la escritura se retrasan, las colas se llenan y las
+    descargas se detienen hasta que haya espacio.
+    """
+
+    def __init__(self, guardar, hilos_descarga=4, procesos_parseo=None, tam_cola=32, delay=2,
+                 descargar=None, parsear=None):
+        """
+        :param guardar: Función que recibe cada Vehiculo encontrado
+        :param hilos_descarga: Cantidad de descargas simultáneas
+        :param procesos_parseo: Procesos del pool de parseo (por defecto, uno por núcleo)
+        :param tam_cola: Máximo de elementos pendientes entre etapas
+        :param delay: Espera de cada hilo entre consultas (en segundos)
+        """
+        self.guardar = guardar
+        self.hilos_descarga = hilos_descarga
+        self.procesos_parseo = procesos_parseo
+        self.tam_cola = tam_cola
+        self.delay = delay
+        self._descargar = descargar or VehiculoService.descargar_html
+        self._parsear = parsear or VehiculoService.parsear_html
+
+    @staticmethod
+    def _poner(cola, elemento, detener):
+        """Pone el elemento en la cola; retorna False si se pidió detener el pipeline"""
+        while not detener.is_set():
+            try:
+                cola.put(elemento, timeout=_ESPERA)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    @staticmethod
+    def _obtener(cola, detener):
+        """Saca un elemento de la cola; retorna _FIN si se pidió detener el pipeline"""
+        while not detener.is_set():
+            try:
+                return cola.get(timeout=_ESPERA)
+            except queue.Empty:
+                pass
+        return _FIN
+
+    def _producir(self, placas, cola_placas, detener):
+        for placa in placas:
+            if not self._poner(cola_placas, placa, detener):
+                return
+        for _ in range(self.hilos_descarga):
+            if not self._poner(cola_placas, _FIN, detener):
+                return
+
+    def _descargar_placas(self, cola_placas, cola_html, detener):
+        while True:
+            placa = self._obtener(cola_placas, detener)
+            if placa is _FIN:
+                self._poner(cola_html, _FIN, detener)
+                return
+
+            try:
+                placa_normalizada, contenido = self._descargar(placa)
+                elemento = (placa_normalizada, contenido, None)
+            except Exception as e:
+                elemento = (placa, None, e)
+
+            if not self._poner(cola_html, elemento, detener):
+                return
+            detener.wait(self.delay)
+
+    def _despachar_parseo(self, pool, cola_html, cola_resultados, cupos, detener):
+        """
+        Envía el HTML al pool; cada envío ocupa un cupo que libera la escritura.
+        Al terminar, por fin de datos o por error, siempre avisa a la escritura
+        con (_FIN, enviados, error)
+        """
+        enviados = 0
+        fines = 0
+        error_fatal = None
+
+        try:
+            while fines < self.hilos_descarga:
+                elemento = self._obtener(cola_html, detener)
+                if detener.is_set():
+                    return
+                if elemento is _FIN:
+                    fines += 1
+                    continue
+
+                placa, contenido, error = elemento
+                while not cupos.acquire(timeout=_ESPERA):
+                    if detener.is_set():
+                        return
+                enviados += 1
+
+                if error is not None:
+                    cola_resultados.put((placa, None, error))
+                    continue
+
+                futuro = pool.submit(self._parsear, placa, contenido)
+                futuro.add_done_callback(
+                    lambda f, placa=placa: cola_resultados.put(
+                        (placa, None, f.exception()) if f.exception() else (placa, f.result(), None)))
+        except BaseException as e:
+            # Por ejemplo BrokenProcessPool si murió un proceso de parseo
+            error_fatal = e
+        finally:
+            cola_resultados.put((_FIN, enviados, error_fatal))
+
+    def procesar(self, placas):
+        """
+        Consulta todas las placas y guarda los vehículos encontrados
+        Retorna la cantidad de vehículos guardados
+        Si guardar falla o el pool de parseo se rompe, se detienen las demás
+        etapas y se propaga la excepción
+        """
+        cola_placas = queue.Queue(self.tam_cola)
+        cola_html = queue.Queue(self.tam_cola)
+        cola_resultados = queue.Queue()
+        cupos = threading.BoundedSemaphore(self.tam_cola)
+        detener = threading.Event()
+
+        guardados = 0
+        procesados = 0
+        total = None
+
+        with ProcessPoolExecutor(self.procesos_parseo) as pool:
+            hilos = [threading.Thread(target=self._producir, args=(placas, cola_placas, detener), daemon=True),
+                     threading.Thread(target=self._despachar_parseo,
+                                      args=(pool, cola_html, cola_resultados, cupos, detener), daemon=True)]
+            hilos += [threading.Thread(target=self._descargar_placas,
+                                       args=(cola_placas, cola_html, detener), daemon=True)
+                      for _ in range(self.hilos_descarga)]
+            for hilo in hilos:
+                hilo.start()
+
+            try:
+                while total is None or procesados < total:
+                    placa, vehiculo, error = cola_resultados.get()
+                    if placa is _FIN:
+                        if error is not None:
+                            raise error
+                        total = vehiculo
+                        continue
+                    if isinstance(error, BrokenProcessPool):
+                        # Un proceso de parseo murió: el pool ya no puede usarse
+                        raise error
+
+                    procesados += 1
+                    try:
+                        if error is not None:
+                            print(f"Error al consultar {placa}: {str(error)}")
+                        elif vehiculo:
+                            self.guardar(vehiculo)
+                            guardados += 1
+                            print(f"Guardada {placa} ({guardados})")
+                        else:
+                            print(f"No se encontró información para {placa}")
+                    finally:
+                        cupos.release()
+            except BaseException:
+                detener.set()
+                raise
+            finally:
+                for hilo in hilos:
+                    hilo.join()
+
+        return guardados
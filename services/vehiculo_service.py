@@ -1,6 +1,4 @@
-import requests
 import re
-from bs4 import BeautifulSoup
 from models.vehiculo_model import Vehiculo
 
 
@@ -42,6 +40,15 @@ class VehiculoService:
         Obtiene información de un vehículo por su placa
         Primero normaliza la placa y luego realiza la consulta
         """
+        placa_normalizada, contenido = VehiculoService.descargar_html(placa)
+        return VehiculoService.parsear_html(placa_normalizada, contenido)
+
+    @staticmethod
+    def descargar_html(placa):
+        """
+        Normaliza la placa y descarga la respuesta del portal ANT sin procesarla
+        Retorna (placa_normalizada, contenido en bytes)
+        """
         # Normalizar la placa primero
         placa_normalizada = VehiculoService.normalizar_placa(placa)
 
@@ -49,47 +56,59 @@ class VehiculoService:
             raise ValueError(
                 f"Formato de placa inválido: {placa}. Formatos aceptados: ABC123, ABC0123 o JK563Y")
 
+        # Importación diferida: requests solo se carga al consultar el portal
+        import requests
+
         url = f"https://consultaweb.ant.gob.ec/PortalWEB/paginas/clientes/clp_grid_citaciones.jsp?ps_tipo_identificacion=PLA&ps_identificacion={placa_normalizada}&ps_placa="
 
         try:
             respuesta = requests.get(url, timeout=10)
             respuesta.raise_for_status()  # Lanza excepción para códigos 4XX/5XX
-
-            soup = BeautifulSoup(respuesta.content, 'html.parser')
-            tabla = soup.find(
-                'table', {'border': '0', 'cellspacing': '1', 'cellpadding': '2'})
-
-            if not tabla:
-                return None
-
-            filas = tabla.find_all('tr')
-            info_vehiculo = {}
-
-            for fila in filas:
-                titulos = fila.find_all('td', class_='titulo')
-                detalles = fila.find_all('td', class_='detalle_formulario')
-
-                if len(titulos) == len(detalles):
-                    for titulo, detalle in zip(titulos, detalles):
-                        clave = titulo.get_text(
-                            strip=True).replace(':', '').strip()
-                        valor = detalle.get_text(strip=True)
-                        info_vehiculo[clave] = valor
-
-            return Vehiculo(
-                placa=placa_normalizada,
-                marca=info_vehiculo.get("Marca"),
-                color=info_vehiculo.get("Color"),
-                anio_matricula=info_vehiculo.get("Año de Matrícula"),
-                modelo=info_vehiculo.get("Modelo"),
-                clase=info_vehiculo.get("Clase"),
-                fecha_matricula=info_vehiculo.get("Fecha de Matrícula"),
-                anio=info_vehiculo.get("Año"),
-                servicio=info_vehiculo.get("Servicio"),
-                fecha_caducidad=info_vehiculo.get("Fecha de Caducidad"),
-                polarizado=info_vehiculo.get(
-                    "Polarizado", "No existe registro de polarizado")
-            )
+            return placa_normalizada, respuesta.content
 
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"Error al consultar el servicio ANT: {str(e)}")
+
+    @staticmethod
+    def parsear_html(placa_normalizada, contenido):
+        """
+        Convierte el HTML del portal ANT en un Vehiculo, o None si no hay registro
+        No usa red, por lo que puede ejecutarse en otro proceso
+        """
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(contenido, 'html.parser')
+        tabla = soup.find(
+            'table', {'border': '0', 'cellspacing': '1', 'cellpadding': '2'})
+
+        if not tabla:
+            return None
+
+        filas = tabla.find_all('tr')
+        info_vehiculo = {}
+
+        for fila in filas:
+            titulos = fila.find_all('td', class_='titulo')
+            detalles = fila.find_all('td', class_='detalle_formulario')
+
+            if len(titulos) == len(detalles):
+                for titulo, detalle in zip(titulos, detalles):
+                    clave = titulo.get_text(
+                        strip=True).replace(':', '').strip()
+                    valor = detalle.get_text(strip=True)
+                    info_vehiculo[clave] = valor
+
+        return Vehiculo(
+            placa=placa_normalizada,
+            marca=info_vehiculo.get("Marca"),
+            color=info_vehiculo.get("Color"),
+            anio_matricula=info_vehiculo.get("Año de Matrícula"),
+            modelo=info_vehiculo.get("Modelo"),
+            clase=info_vehiculo.get("Clase"),
+            fecha_matricula=info_vehiculo.get("Fecha de Matrícula"),
+            anio=info_vehiculo.get("Año"),
+            servicio=info_vehiculo.get("Servicio"),
+            fecha_caducidad=info_vehiculo.get("Fecha de Caducidad"),
+            polarizado=info_vehiculo.get(
+                "Polarizado", "No existe registro de polarizado")
+        )
@@ -0,0 +1,81 @@
+import json
+from urllib.parse import unquote, urlsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from services.consulta_service import ConsultaService, LimiteExcedidoError
+
+HOST = '127.0.0.1'
+PUERTO = 8080
+
+
+class ManejadorConsultas(BaseHTTPRequestHandler):
+    """
+    Endpoints:
+    - GET  /vehiculos/<placa>          -> datos del vehículo
+    - POST /vehiculos/lote {"placas": [...]} -> datos de varias placas
+    """
+    servicio = None
+
+    def _responder(self, codigo, datos):
+        cuerpo = json.dumps(datos, ensure_ascii=False).encode('utf-8')
+        self.send_response(codigo)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def do_GET(self):
+        # Ignorar la query string: /vehiculos/ABC123?x=1
+        partes = unquote(urlsplit(self.path).path).strip('/').split('/')
+        if len(partes) != 2 or partes[0] != 'vehiculos':
+            self._responder(404, {'error': 'Ruta no encontrada'})
+            return
+
+        try:
+            vehiculo = self.servicio.buscar(partes[1], self.client_address[0])
+        except ValueError as e:
+            self._responder(400, {'error': str(e)})
+            return
+        except LimiteExcedidoError as e:
+            self._responder(429, {'error': str(e)})
+            return
+        except RuntimeError as e:
+            self._responder(502, {'error': str(e)})
+            return
+
+        if vehiculo:
+            self._responder(200, vehiculo.to_dict())
+        else:
+            self._responder(404, {'error': f"No se encontró información para {partes[1]}"})
+
+    def do_POST(self):
+        if urlsplit(self.path).path.rstrip('/') != '/vehiculos/lote':
+            self._responder(404, {'error': 'Ruta no encontrada'})
+            return
+
+        try:
+            longitud = int(self.headers.get('Content-Length', 0))
+            placas = json.loads(self.rfile.read(longitud))['placas']
+            if not isinstance(placas, list) or not all(isinstance(p, str) for p in placas):
+                raise ValueError
+        except (ValueError, KeyError, TypeError):
+            self._responder(400, {'error': 'Se esperaba un JSON con la lista de textos "placas"'})
+            return
+
+        self._responder(200, self.servicio.buscar_lote(placas, self.client_address[0]))
+
+
+def iniciar_servidor(host=HOST, puerto=PUERTO, archivo_dataset='dataset.csv'):
+    ManejadorConsultas.servicio = ConsultaService(archivo_dataset)
+    servidor = ThreadingHTTPServer((host, puerto), ManejadorConsultas)
+    print(f"Índice cargado: {len(ManejadorConsultas.servicio.indice)} placas")
+    print(f"Servidor de consultas escuchando en http://{host}:{puerto}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print("\nDeteniendo servidor...")
+    finally:
+        servidor.server_close()
+
+
+if __name__ == "__main__":
+    iniciar_servidor()
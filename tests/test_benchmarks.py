@@ -0,0 +1,19 @@
+from benchmarks.ejecutar import comparar
+
+
+def _resultado(minimo, desviacion):
+    return {'meta': {'tamano': '10k'},
+            'resultados': {'extraer': {'minimo_s': minimo, 'desviacion_s': desviacion}}}
+
+
+def test_comparar_ignora_cambios_dentro_del_ruido():
+    # +50 % pero con una desviación que lo cubre
+    assert comparar(_resultado(0.030, 0.006), _resultado(0.020, 0.001), 0.2) == []
+
+
+def test_comparar_detecta_regresion_fuera_de_tolerancia_y_ruido():
+    assert comparar(_resultado(0.030, 0.001), _resultado(0.020, 0.001), 0.2) == ['extraer']
+
+
+def test_comparar_respeta_la_tolerancia_con_poco_ruido():
+    assert comparar(_resultado(0.023, 0.0001), _resultado(0.020, 0.0001), 0.2) == []
@@ -0,0 +1,92 @@
+import csv
+import random
+import pytest
+from models.vehiculo_model import Vehiculo
+from tools.combinar_datasets.combinar_datasets import combinar_datasets
+
+
+def _escribir(ruta, filas):
+    with open(ruta, mode='w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=Vehiculo.CAMPOS_CSV)
+        writer.writeheader()
+        for fila in filas:
+            writer.writerow(fila)
+    return str(ruta)
+
+
+def _leer(ruta):
+    with open(ruta, newline='', encoding='utf-8') as file:
+        return list(csv.DictReader(file))
+
+
+def _fila(placa, marca='KIA', fecha_matricula='01-01-2020'):
+    return {'placa': placa, 'marca': marca, 'fecha_matricula': fecha_matricula}
+
+
+@pytest.fixture
+def hosts(tmp_path):
+    a = _escribir(tmp_path / 'a.csv', [_fila('ABC0123', 'A', '10-05-2021'), _fila('GBB0001', 'A', '01-01-2020')])
+    b = _escribir(tmp_path / 'b.csv', [_fila('ABC0123', 'B', '01-02-2019'), _fila('GBB0001', 'B', '01-01-2020')])
+    return a, b
+
+
+def test_politica_fecha_matricula_gana_la_mas_reciente_y_en_empate_el_ultimo(tmp_path, hosts):
+    salida = str(tmp_path / 'salida.csv')
+    resumen = combinar_datasets(list(hosts), salida)
+
+    filas = {fila['placa']: fila['marca'] for fila in _leer(salida)}
+    assert filas == {'ABC0123': 'A', 'GBB0001': 'B'}
+    assert resumen == {'leidas': 4, 'unicas': 2, 'conflictos': 2}
+
+
+@pytest.mark.parametrize('politica, esperado', [('primero', 'A'), ('ultimo', 'B')])
+def test_politicas_primero_y_ultimo(tmp_path, hosts, politica, esperado):
+    salida = str(tmp_path / 'salida.csv')
+    combinar_datasets(list(hosts), salida, politica=politica)
+
+    assert {fila['marca'] for fila in _leer(salida)} == {esperado}
+
+
+def test_politica_desconocida(tmp_path, hosts):
+    with pytest.raises(ValueError):
+        combinar_datasets(list(hosts), str(tmp_path / 'salida.csv'), politica='azar')
+
+
+def test_placas_se_normalizan_como_en_el_consultor(tmp_path):
+    a = _escribir(tmp_path / 'a.csv', [_fila('abc123', 'A')])
+    b = _escribir(tmp_path / 'b.csv', [_fila('ABC0123', 'B')])
+    salida = str(tmp_path / 'salida.csv')
+
+    combinar_datasets([a, b], salida, politica='ultimo')
+
+    assert [(fila['placa'], fila['marca']) for fila in _leer(salida)] == [('ABC0123', 'B')]
+
+
+def test_archivos_desordenados_se_ordenan_por_bloques_y_pasadas(tmp_path):
+    placas = [f"ABC{i:04d}" for i in range(500)]
+    desordenadas = placas[:]
+    random.Random(0).shuffle(desordenadas)
+    a = _escribir(tmp_path / 'a.csv', [_fila(placa, 'A') for placa in desordenadas])
+    b = _escribir(tmp_path / 'b.csv', [_fila(placa, 'B') for placa in desordenadas[:100]])
+    salida = str(tmp_path / 'salida.csv')
+    archivo_placas = str(tmp_path / 'placas.txt')
+
+    # 300 bloques mezclados de a 4 archivos: varias pasadas intermedias
+    resumen = combinar_datasets([a, b], salida, archivo_placas, politica='ultimo',
+                                tam_bloque=2, max_abiertos=4)
+
+    filas = _leer(salida)
+    assert [fila['placa'] for fila in filas] == placas
+    assert resumen == {'leidas': 600, 'unicas': 500, 'conflictos': 100}
+    # El orden de las entradas se conserva en las pasadas: 'ultimo' elige b
+    assert {fila['placa'] for fila in filas if fila['marca'] == 'B'} == set(desordenadas[:100])
+    with open(archivo_placas, encoding='utf-8') as file:
+        assert file.read().split() == placas
+
+
+def test_salida_puede_ser_uno_de_los_archivos_de_entrada(tmp_path, hosts):
+    a, b = hosts
+    combinar_datasets([a, b], a)
+
+    assert [fila['placa'] for fila in _leer(a)] == ['ABC0123', 'GBB0001']
+    assert not [ruta for ruta in tmp_path.iterdir() if ruta.name.startswith('tmp')]
@@ -0,0 +1,99 @@
+import csv
+import json
+import threading
+from http.server import ThreadingHTTPServer
+from urllib.request import urlopen
+from models.vehiculo_model import Vehiculo
+from services import consulta_service
+from services.consulta_service import ConsultaService, LimitadorTasa
+from servidor import ManejadorConsultas
+
+
+def test_buscar_no_consulta_dos_veces_si_otra_peticion_termina_entre_tanto(tmp_path):
+    archivo = tmp_path / 'dataset.csv'
+    llamadas = []
+
+    def consultar(placa):
+        llamadas.append(placa)
+        return Vehiculo.from_dict({'placa': placa, 'marca': 'KIA'})
+
+    servicio = ConsultaService(str(archivo), consultar=consultar)
+
+    # B revisa índice y cache sin éxito y se detiene hasta que A termine su consulta
+    b_reviso = threading.Event()
+    a_termino = threading.Event()
+    obtener_original = servicio.cache.obtener
+
+    def obtener(clave):
+        resultado = obtener_original(clave)
+        if threading.current_thread().name == 'B' and not b_reviso.is_set():
+            b_reviso.set()
+            a_termino.wait(5)
+        return resultado
+
+    servicio.cache.obtener = obtener
+    resultados = {}
+
+    def peticion_b():
+        resultados['B'] = servicio.buscar('ZZZ1234')
+
+    hilo_b = threading.Thread(target=peticion_b, name='B')
+    hilo_b.start()
+    assert b_reviso.wait(5)
+
+    resultados['A'] = servicio.buscar('ZZZ1234')
+    a_termino.set()
+    hilo_b.join(5)
+
+    assert llamadas == ['ZZZ1234']
+    assert resultados['A'].marca == resultados['B'].marca == 'KIA'
+    with open(archivo, newline='', encoding='utf-8') as file:
+        assert [row['placa'] for row in csv.DictReader(file)] == ['ZZZ1234']
+
+
+def test_buscar_lote_reporta_errores_inesperados_por_placa(tmp_path):
+    def consultar(placa):
+        if placa == 'ERR0001':
+            raise AttributeError('respuesta inesperada')
+        return Vehiculo.from_dict({'placa': placa, 'marca': 'KIA'})
+
+    servicio = ConsultaService(str(tmp_path / 'dataset.csv'), consultar=consultar)
+    resultados = servicio.buscar_lote(['ERR0001', 'ABC0001'])
+
+    assert 'error' in resultados['ERR0001']
+    assert resultados['ABC0001']['marca'] == 'KIA'
+
+
+def test_limitador_descarta_clientes_con_el_bucket_lleno(monkeypatch):
+    ahora = [1000.0]
+    monkeypatch.setattr(consulta_service.time, 'monotonic', lambda: ahora[0])
+    limitador = LimitadorTasa(tasa=1, rafaga=2)
+
+    for cliente in range(100):
+        assert limitador.permitir(cliente)
+    assert len(limitador._clientes) == 100
+
+    ahora[0] += 1.5
+    assert limitador.permitir('activo')
+    assert limitador.permitir('activo')
+
+    # Pasado el tiempo de llenado solo se recuerda al cliente que aún no recupera la ráfaga
+    ahora[0] += 0.5
+    assert limitador.permitir('otro')
+    assert set(limitador._clientes) == {'activo', 'otro'}
+
+
+def test_servidor_ignora_la_query_string(tmp_path):
+    ManejadorConsultas.servicio = ConsultaService(
+        str(tmp_path / 'dataset.csv'),
+        consultar=lambda placa: Vehiculo.from_dict({'placa': placa, 'marca': 'KIA'}))
+    servidor = ThreadingHTTPServer(('127.0.0.1', 0), ManejadorConsultas)
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    try:
+        with urlopen(f"http://127.0.0.1:{servidor.server_port}/vehiculos/abc123?x=1", timeout=5) as respuesta:
+            assert respuesta.status == 200
+            assert json.loads(respuesta.read())['placa'] == 'ABC0123'
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
@@ -0,0 +1,103 @@
+import csv
+import random
+from datetime import date
+import pytest
+from main import GeneradorConsultorPlacas
+from models.esquema_vehiculo import DatasetTipado, _letra_provincia, parsear_fecha, parsear_polarizado
+from models.vehiculo_model import Vehiculo
+
+
+def test_parsear_fecha_dd_mm_yyyy():
+    assert parsear_fecha('16-10-2020') == date(2020, 10, 16)
+    assert parsear_fecha('31-02-2020') is None
+    assert parsear_fecha('2020-10-16') is None
+    assert parsear_fecha('') is None
+    assert parsear_fecha(None) is None
+
+
+def test_parsear_polarizado():
+    assert parsear_polarizado('No existe registro de polarizado') is False
+    assert parsear_polarizado('SI') is True
+    assert parsear_polarizado('') is None
+
+
+def test_valores_faltantes_se_guardan_como_cero_y_se_leen_como_none(tmp_path):
+    archivo = tmp_path / 'dataset.csv'
+    with open(archivo, mode='w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=Vehiculo.CAMPOS_CSV)
+        writer.writeheader()
+        writer.writerow({'placa': 'GBB0001', 'anio': '2011', 'fecha_caducidad': '15-10-2025',
+                         'polarizado': 'No existe registro de polarizado'})
+        writer.writerow({'placa': 'GBB0002'})
+
+    dataset = DatasetTipado.desde_csv(str(archivo))
+
+    assert list(dataset.columnas['anio']) == [2011, 0]
+    assert list(dataset.columnas['fecha_caducidad']) == [date(2025, 10, 15).toordinal(), 0]
+    assert dataset.fila(0)['fecha_caducidad'] == date(2025, 10, 15)
+    assert dataset.fila(0)['polarizado'] is False
+    faltantes = dataset.fila(1)
+    assert faltantes['anio'] is None
+    assert faltantes['fecha_caducidad'] is None
+    assert faltantes['polarizado'] is None
+
+
+@pytest.mark.parametrize('provincia, letra', [
+    ('Guayas', 'G'), ('guayas', 'G'), ('  GUAYAS ', 'G'), ('Los Ríos', 'R'), ('los rios', 'R'),
+    ('Galapagos', 'W'), ('g', 'G'), ('P', 'P'),
+])
+def test_letra_provincia(provincia, letra):
+    assert _letra_provincia(provincia) == letra
+
+
+@pytest.mark.parametrize('provincia', ['Guayaquil', 'GG', '1', ''])
+def test_letra_provincia_invalida(provincia):
+    with pytest.raises(ValueError):
+        _letra_provincia(provincia)
+
+
+def _vehiculo(rng, i):
+    return Vehiculo.from_dict({
+        'placa': rng.choice('GPMA') + f"BC{i:04d}",
+        'anio': str(rng.randint(1990, 2024)) if rng.random() > 0.1 else '',
+        'fecha_caducidad': f"{rng.randint(1, 28):02d}-{rng.randint(1, 12):02d}-{rng.randint(2015, 2030)}",
+    })
+
+
+def _filtrar_fila_por_fila(dataset, anio_desde, anio_hasta, caduca_desde, caduca_hasta, letra):
+    esperado = []
+    for i in range(len(dataset)):
+        fila = dataset.fila(i)
+        if fila['anio'] is None or not anio_desde <= fila['anio'] <= anio_hasta:
+            continue
+        if not caduca_desde <= fila['fecha_caducidad'] <= caduca_hasta:
+            continue
+        if fila['placa'][0] != letra:
+            continue
+        esperado.append(i)
+    return esperado
+
+
+def test_filtrar_con_indices_coincide_con_recorrido_completo_tambien_tras_agregar():
+    rng = random.Random(0)
+    dataset = DatasetTipado()
+    for i in range(300):
+        dataset.agregar(_vehiculo(rng, i))
+
+    filtros = (2000, 2010, date(2020, 1, 1), date(2025, 6, 30), 'G')
+    assert dataset.filtrar(*filtros[:4], provincia='Guayas') == _filtrar_fila_por_fila(dataset, *filtros)
+
+    # Los índices ya construidos se actualizan con los vehículos nuevos
+    for i in range(300, 400):
+        dataset.agregar(_vehiculo(rng, i))
+    assert dataset.filtrar(*filtros[:4], provincia='g') == _filtrar_fila_por_fila(dataset, *filtros)
+    assert dataset.filtrar() == list(range(400))
+
+
+def test_guardar_vehiculo_agrega_al_dataset_tipado(tmp_path):
+    dataset = DatasetTipado()
+    consultor = GeneradorConsultorPlacas(str(tmp_path / 'dataset.csv'), dataset_tipado=dataset)
+
+    consultor.guardar_vehiculo(Vehiculo.from_dict({'placa': 'GBB0001', 'anio': '2011'}))
+
+    assert dataset.filtrar(anio_desde=2011, anio_hasta=2011) == [0]
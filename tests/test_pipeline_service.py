@@ -0,0 +1,51 @@
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+import pytest
+from models.vehiculo_model import Vehiculo
+from services.pipeline_service import PipelineConsultas
+
+
+def _parsear(placa, contenido):
+    return Vehiculo.from_dict({'placa': placa, 'marca': contenido.decode()})
+
+
+def test_procesar_guarda_todos_los_vehiculos():
+    guardados = []
+    pipeline = PipelineConsultas(guardados.append, hilos_descarga=3, procesos_parseo=2, tam_cola=2,
+                                 delay=0, descargar=lambda placa: (placa, b'KIA'), parsear=_parsear)
+
+    assert pipeline.procesar([f"ABC{i:04d}" for i in range(20)]) == 20
+    assert sorted(v.placa for v in guardados) == [f"ABC{i:04d}" for i in range(20)]
+
+
+def test_procesar_detiene_las_etapas_si_guardar_falla():
+    def guardar(vehiculo):
+        raise IOError('disco lleno')
+
+    pipeline = PipelineConsultas(guardar, hilos_descarga=3, procesos_parseo=2, tam_cola=2,
+                                 delay=0, descargar=lambda placa: (placa, b'KIA'), parsear=_parsear)
+    hilos_antes = threading.active_count()
+
+    with pytest.raises(IOError):
+        pipeline.procesar([f"ABC{i:04d}" for i in range(200)])
+
+    assert threading.active_count() == hilos_antes
+
+
+def _parsear_y_morir(placa, contenido):
+    if placa == 'ABC0003':
+        os._exit(1)
+    return _parsear(placa, contenido)
+
+
+def test_procesar_termina_si_se_rompe_el_pool_de_parseo():
+    guardados = []
+    pipeline = PipelineConsultas(guardados.append, hilos_descarga=3, procesos_parseo=2, tam_cola=2, delay=0,
+                                 descargar=lambda placa: (placa, b'KIA'), parsear=_parsear_y_morir)
+    hilos_antes = threading.active_count()
+
+    with pytest.raises(BrokenProcessPool):
+        pipeline.procesar([f"ABC{i:04d}" for i in range(200)])
+
+    assert threading.active_count() == hilos_antes
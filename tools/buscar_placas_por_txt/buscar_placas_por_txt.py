@@ -1,24 +1,19 @@
-import sys
+import argparse
 import os
-from pathlib import Path
 import csv
 from time import sleep
+from models.vehiculo_model import Vehiculo
+from services.vehiculo_service import VehiculoService
 
-# Configuración de paths - IMPORTANTE
-current_dir = Path(__file__).parent.absolute()  # Directorio del script actual
-# Subir dos niveles a la raíz del proyecto
-project_root = current_dir.parent.parent
 
-# Añadir el directorio raíz al path de Python
-sys.path.insert(0, str(project_root))
-
-
-def agregar_placas_desde_txt():
-    # Archivos fijos (hardcoded)
-    # Archivo con las placas a agregar (una por línea)
-    archivo_placas_txt = 'tools/buscar_placas_por_txt/placas.txt'
-    archivo_csv = 'dataset.csv'  # Archivo CSV principal
-    archivo_backup = 'tools/buscar_placas_por_txt/dataset_backup.csv'  # Backup por seguridad
+def agregar_placas_desde_txt(archivo_placas_txt='placas.txt', archivo_csv='dataset.csv',
+                             archivo_backup='dataset_backup.csv'):
+    """
+    Consulta las placas de un archivo .txt y agrega al CSV las que no existan
+    :param archivo_placas_txt: Archivo con las placas a agregar (una por línea)
+    :param archivo_csv: Archivo CSV principal
+    :param archivo_backup: Copia del CSV antes de modificarlo, por seguridad
+    """
 
     print(
         f"\nIniciando proceso para agregar placas desde {archivo_placas_txt}")
@@ -77,15 +72,9 @@ def agregar_placas_desde_txt():
         print(f"Error al leer el archivo .txt: {str(e)}")
         return
 
-    # 5. Configurar el servicio de consulta
-    from services.vehiculo_service import VehiculoService
-    # 6. Procesar cada placa nueva
+    # 5. Procesar cada placa nueva
     exitosas = 0
-    fieldnames = [
-        'placa', 'marca', 'modelo', 'anio', 'color',
-        'clase', 'fecha_matricula', 'anio_matricula', 'servicio',
-        'fecha_caducidad', 'polarizado'
-    ]
+    fieldnames = Vehiculo.CAMPOS_CSV
 
     print("\nIniciando consultas...")
     for i, placa in enumerate(placas_a_agregar, 1):
@@ -113,14 +102,28 @@ def agregar_placas_desde_txt():
         except Exception as e:
             print(f"✗ Error: {str(e)}")
 
-    # 7. Resumen final
+    # 6. Resumen final
     print("\nResumen:")
     print(f"- Placas procesadas: {len(placas_a_agregar)}")
     print(f"- Placas agregadas exitosamente: {exitosas}")
     print(f"- Placas no encontradas: {len(placas_a_agregar) - exitosas}")
 
 
-if __name__ == "__main__":
+def main():
+    parser = argparse.ArgumentParser(
+        description="Agrega al dataset las placas listadas en un archivo .txt")
+    parser.add_argument('--placas', default='placas.txt',
+                        help="Archivo con las placas, una por línea (por defecto 'placas.txt')")
+    parser.add_argument('--dataset', default='dataset.csv',
+                        help="CSV principal (por defecto 'dataset.csv')")
+    parser.add_argument('--backup', default='dataset_backup.csv',
+                        help="Copia de seguridad del CSV (por defecto 'dataset_backup.csv')")
+    args = parser.parse_args()
+
     print("Agregador de Placas desde archivo .txt")
     print("=====================================")
-    agregar_placas_desde_txt()
+    agregar_placas_desde_txt(args.placas, args.dataset, args.backup)
+
+
+if __name__ == "__main__":
+    main()
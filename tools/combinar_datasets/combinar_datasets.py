@@ -0,0 +1,234 @@
+import argparse
+import csv
+import heapq
+import os
+import tempfile
+from datetime import date
+from itertools import count, groupby
+from models.esquema_vehiculo import parsear_fecha
+from models.vehiculo_model import Vehiculo
+from services.vehiculo_service import VehiculoService
+
+# Máximo de archivos que se mezclan a la vez; si hay más, se mezclan por pasadas
+MAX_ARCHIVOS_ABIERTOS = 64
+
+
+def _clave_placa(fila):
+    return fila['placa']
+
+
+def _leer_filas(archivo):
+    """
+    Recorre el CSV fila por fila normalizando la placa igual que el consultor
+    (ABC123 -> ABC0123). Las placas con formato no reconocido solo se pasan a mayúsculas
+    """
+    with open(archivo, mode='r', newline='', encoding='utf-8') as file:
+        for row in csv.DictReader(file):
+            placa = (row.get('placa') or '').strip()
+            placa = VehiculoService.normalizar_placa(placa) or placa.upper()
+            if placa:
+                row['placa'] = placa
+                yield {campo: row.get(campo) for campo in Vehiculo.CAMPOS_CSV}
+
+
+def _esta_ordenado(archivo):
+    anterior = ''
+    for fila in _leer_filas(archivo):
+        if fila['placa'] < anterior:
+            return False
+        anterior = fila['placa']
+    return True
+
+
+def _escribir_filas(archivo, filas):
+    with open(archivo, mode='w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=Vehiculo.CAMPOS_CSV)
+        writer.writeheader()
+        writer.writerows(filas)
+
+
+def _ruta_bloque(directorio_temp, contador):
+    return os.path.join(directorio_temp, f"bloque_{next(contador)}.csv")
+
+
+def _ordenar_en_bloques(archivo, directorio_temp, tam_bloque, contador):
+    """
+    Ordena un CSV sin cargarlo completo: escribe bloques de tam_bloque filas
+    ordenadas en archivos temporales y retorna sus rutas
+    """
+    bloques = []
+    filas = []
+
+    def volcar():
+        filas.sort(key=_clave_placa)
+        ruta = _ruta_bloque(directorio_temp, contador)
+        _escribir_filas(ruta, filas)
+        bloques.append(ruta)
+        filas.clear()
+
+    for fila in _leer_filas(archivo):
+        filas.append(fila)
+        if len(filas) >= tam_bloque:
+            volcar()
+    if filas:
+        volcar()
+
+    return bloques
+
+
+def _mezclar_por_pasadas(fuentes, directorio_temp, max_abiertos, contador):
+    """
+    Mezcla grupos consecutivos de max_abiertos fuentes en bloques temporales
+    hasta que queden max_abiertos o menos. Conserva el orden de las fuentes
+    para las placas repetidas, y borra los bloques intermedios ya mezclados
+    """
+    while len(fuentes) > max_abiertos:
+        siguientes = []
+        for inicio in range(0, len(fuentes), max_abiertos):
+            grupo = fuentes[inicio:inicio + max_abiertos]
+            if len(grupo) == 1:
+                siguientes.extend(grupo)
+                continue
+
+            ruta = _ruta_bloque(directorio_temp, contador)
+            _escribir_filas(ruta, heapq.merge(*(_leer_filas(fuente) for fuente in grupo),
+                                              key=_clave_placa))
+            siguientes.append(ruta)
+            for fuente in grupo:
+                if os.path.dirname(fuente) == directorio_temp:
+                    os.remove(fuente)
+        fuentes = siguientes
+    return fuentes
+
+
+def _fecha_o_minima(fila):
+    return parsear_fecha(fila['fecha_matricula']) or date.min
+
+
+# Cómo elegir una fila cuando la misma placa aparece en varios archivos.
+# Los candidatos llegan en el orden de los archivos de entrada.
+POLITICAS = {
+    # Gana la matrícula más reciente; en empate, el último archivo
+    'fecha_matricula': lambda candidatos: max(reversed(candidatos), key=_fecha_o_minima),
+    'primero': lambda candidatos: candidatos[0],
+    'ultimo': lambda candidatos: candidatos[-1],
+}
+
+
+def combinar_datasets(archivos, archivo_salida, archivo_placas=None, politica='fecha_matricula',
+                      tam_bloque=100000, max_abiertos=MAX_ARCHIVOS_ABIERTOS):
+    """
+    Combina varios datasets en uno solo sin placas repetidas (k-way merge).
+
+    Args:
+        archivos (list): Rutas de los CSV a combinar
+        archivo_salida (str): CSV resultante, ordenado por placa. Puede ser uno de los de entrada
+        archivo_placas (str): Si se indica, guarda también la lista de placas (una por línea)
+        politica (str): Regla para resolver placas repetidas (ver POLITICAS)
+        tam_bloque (int): Filas por bloque al ordenar archivos desordenados
+        max_abiertos (int): Máximo de archivos abiertos a la vez durante la mezcla
+
+    Returns:
+        dict: Cantidad de filas leídas, placas únicas y conflictos resueltos
+    """
+    if politica not in POLITICAS:
+        raise ValueError(
+            f"Política desconocida: {politica}. Opciones: {', '.join(POLITICAS)}")
+    elegir = POLITICAS[politica]
+
+    for archivo in archivos:
+        if not os.path.exists(archivo):
+            raise FileNotFoundError(
+                f"Error: No se encontró el archivo {os.path.abspath(archivo)}")
+
+    leidas = 0
+    unicas = 0
+    conflictos = 0
+    directorio_salida = os.path.dirname(os.path.abspath(archivo_salida))
+
+    with tempfile.TemporaryDirectory() as directorio_temp:
+        # Paso 1: Obtener una secuencia ordenada por placa de cada archivo
+        contador = count()
+        fuentes = []
+        for archivo in archivos:
+            if _esta_ordenado(archivo):
+                fuentes.append(archivo)
+            else:
+                print(f"{archivo} no está ordenado por placa, ordenando por bloques...")
+                fuentes.extend(_ordenar_en_bloques(archivo, directorio_temp, tam_bloque, contador))
+
+        # Paso 2: Limitar la cantidad de archivos que se abren en la mezcla final
+        fuentes = _mezclar_por_pasadas(fuentes, directorio_temp, max_abiertos, contador)
+
+        # Paso 3: Mezclar todas las secuencias y resolver las placas repetidas
+        salida_temp = tempfile.NamedTemporaryFile(
+            mode='w', newline='', encoding='utf-8', suffix='.csv', dir=directorio_salida, delete=False)
+        placas_temp = None
+        if archivo_placas:
+            placas_temp = tempfile.NamedTemporaryFile(
+                mode='w', encoding='utf-8', suffix='.txt',
+                dir=os.path.dirname(os.path.abspath(archivo_placas)), delete=False)
+
+        try:
+            with salida_temp:
+                writer = csv.DictWriter(salida_temp, fieldnames=Vehiculo.CAMPOS_CSV)
+                writer.writeheader()
+                mezcla = heapq.merge(*(_leer_filas(fuente) for fuente in fuentes), key=_clave_placa)
+
+                for placa, grupo in groupby(mezcla, key=_clave_placa):
+                    candidatos = list(grupo)
+                    leidas += len(candidatos)
+                    unicas += 1
+                    if len(candidatos) > 1:
+                        conflictos += 1
+
+                    writer.writerow(elegir(candidatos))
+                    if placas_temp:
+                        placas_temp.write(f"{placa}\n")
+
+            if placas_temp:
+                placas_temp.close()
+                os.replace(placas_temp.name, archivo_placas)
+            os.replace(salida_temp.name, archivo_salida)
+        except BaseException:
+            for temp in (salida_temp, placas_temp):
+                if temp:
+                    temp.close()
+                    if os.path.exists(temp.name):
+                        os.remove(temp.name)
+            raise
+
+    return {'leidas': leidas, 'unicas': unicas, 'conflictos': conflictos}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Combina datasets de placas generados en varias máquinas")
+    parser.add_argument('archivos', nargs='+', help="CSV a combinar")
+    parser.add_argument('-o', '--salida', default='dataset.csv',
+                        help="CSV resultante (por defecto 'dataset.csv')")
+    parser.add_argument('--placas', help="Archivo donde guardar la lista de placas")
+    parser.add_argument('--politica', default='fecha_matricula', choices=list(POLITICAS),
+                        help="Cómo resolver placas repetidas")
+    parser.add_argument('--tam-bloque', type=int, default=100000,
+                        help="Filas por bloque al ordenar archivos desordenados")
+    args = parser.parse_args()
+
+    print("Combinador de Datasets de Placas")
+    print("================================")
+    try:
+        resumen = combinar_datasets(args.archivos, args.salida, args.placas,
+                                    args.politica, args.tam_bloque)
+    except (FileNotFoundError, ValueError) as e:
+        print(str(e))
+        return
+
+    print("\nResumen:")
+    print(f"- Filas leídas: {resumen['leidas']}")
+    print(f"- Placas únicas: {resumen['unicas']}")
+    print(f"- Placas repetidas resueltas: {resumen['conflictos']}")
+    print(f"Resultados guardados en: {os.path.abspath(args.salida)}")
+
+
+if __name__ == "__main__":
+    main()
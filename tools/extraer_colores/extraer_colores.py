@@ -1,3 +1,4 @@
+import argparse
 import csv
 import os
 from typing import List
@@ -51,15 +52,22 @@ def extraer_y_guardar_colores(archivo_csv: str, archivo_salida: str = 'colores.t
         raise Exception(f"Error durante el procesamiento: {str(e)}")
 
 
-if __name__ == "__main__":
-    # Configuración de rutas según tu estructura de proyecto
-    # Sube 3 niveles desde tools/extraer_colores
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-    archivo_entrada = os.path.join(base_dir, 'dataset.csv')
-    archivo_salida = os.path.join(os.path.dirname(__file__), 'colores.txt')
+def main():
+    # Por defecto se lee y escribe en el directorio de trabajo, igual que en main.py
+    parser = argparse.ArgumentParser(
+        description="Extrae los colores únicos de los vehículos del dataset")
+    parser.add_argument('--dataset', default='dataset.csv',
+                        help="CSV de entrada (por defecto 'dataset.csv')")
+    parser.add_argument('-o', '--salida', default='colores.txt',
+                        help="Archivo de salida (por defecto 'colores.txt')")
+    args = parser.parse_args()
 
     # Ejecutar el proceso
     try:
-        extraer_y_guardar_colores(archivo_entrada, archivo_salida)
+        extraer_y_guardar_colores(args.dataset, args.salida)
     except Exception as e:
         print(str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,13 @@
+import argparse
 import csv
 from collections import defaultdict
 
 
-def extraer_patrones():
+def extraer_patrones(input_csv='dataset.csv', output_txt='patrones.txt'):
     """
-    Versión simplificada que extrae patrones de placas con valores hardcodeados
+    Versión simplificada que extrae patrones de placas
+    Por defecto lee dataset.csv y guarda en patrones.txt, ambos en el directorio actual
     """
-    input_csv = 'dataset.csv'  # Archivo CSV de entrada fijo
-    output_txt = 'tools\extraer_patron_placa_csv\patrones.txt'  # Archivo de salida fijo
 
     patrones = set()  # Usamos un set para evitar duplicados
 
@@ -62,7 +62,19 @@ def contar_ocurrencias_por_patron(input_csv, patrones):
         print(f"No se pudieron calcular estadísticas: {str(e)}")
 
 
-if __name__ == "__main__":
+def main():
+    parser = argparse.ArgumentParser(
+        description="Extrae los patrones de 3 letras de las placas del dataset")
+    parser.add_argument('--dataset', default='dataset.csv',
+                        help="CSV de entrada (por defecto 'dataset.csv')")
+    parser.add_argument('-o', '--salida', default='patrones.txt',
+                        help="Archivo de salida (por defecto 'patrones.txt')")
+    args = parser.parse_args()
+
     print("Extractor de Patrones de Placas - Versión Simplificada")
     print("======================================================")
-    extraer_patrones()
+    extraer_patrones(args.dataset, args.salida)
+
+
+if __name__ == "__main__":
+    main()